@@ -1,5 +1,7 @@
 import random
 
+import numpy as np
+
 # Checks if a number is a palindrome.
 def is_number_palindrome(number):
     number_str = str(number)
@@ -27,36 +29,36 @@ def determine_employee_eligibility(employee_id):
     
     return eligibility_groups
 
-# Uses Divide and Conquer to process a list of employee IDs and determine eligibility for each.
-def process_employee_ids(employee_ids):
-    if len(employee_ids) == 1:
-        emp_id = employee_ids[0]
-        return {emp_id: determine_employee_eligibility(emp_id)}
-    
-    mid = len(employee_ids) // 2
-    left_part = process_employee_ids(employee_ids[:mid])
-    right_part = process_employee_ids(employee_ids[mid:])
-    
-    return {**left_part, **right_part}
+# Splits 5-digit employee IDs into their digits, least significant first.
+def split_digits(employee_ids):
+    return [(employee_ids // 10 ** place) % 10 for place in range(5)]
 
 # Reads employee IDs from a file, processes them, and writes eligibility results to an output file.
 def main(input_file, output_file):
     try:
         # Read employee IDs from the input file
-        with open(input_file, 'r') as file:
-            employee_ids = [int(line.strip()) for line in file if 10000 <= int(line.strip()) <= 99999]
+        employee_ids = np.loadtxt(input_file, dtype=np.int64, ndmin=1)
+        employee_ids = employee_ids[(employee_ids >= 10000) & (employee_ids <= 99999)]
 
-        # Process eligibility for each employee ID using Divide and Conquer
-        eligibility_dict = process_employee_ids(employee_ids)
+        # Keep only the first occurrence of each ID, in file order
+        _, first_index = np.unique(employee_ids, return_index=True)
+        employee_ids = employee_ids[np.sort(first_index)]
+
+        # Determine eligibility for all employee IDs at once using digit arithmetic
+        d0, d1, d2, d3, d4 = split_digits(employee_ids)
+        is_palindrome = (d0 == d4) & (d1 == d3)
+        is_divisible_by_25 = employee_ids % 25 == 0
+        is_sum_divisible_by_5 = (d0 + d1 + d2 + d3 + d4) % 5 == 0
 
         # Categorize employee IDs into different groups
-        palindrome_group = [eid for eid, groups in eligibility_dict.items() if "Group 1 (Palindrome)" in groups]
-        divisible_by_25_group = [eid for eid, groups in eligibility_dict.items() if "Group 2 (Divisible by 25)" in groups]
-        sum_divisible_by_5_group = [eid for eid, groups in eligibility_dict.items() if "Group 3 (Sum divisible by 5)" in groups]
-        extra_esop_group = [eid for eid, groups in eligibility_dict.items() if "Eligible for extra 10% ESOPs" in groups]
-        
-        total_eligible = len(set(palindrome_group + divisible_by_25_group + sum_divisible_by_5_group))
-        sorted_eligible_ids = sorted(set(palindrome_group + divisible_by_25_group + sum_divisible_by_5_group), reverse=True)
+        palindrome_group = employee_ids[is_palindrome].tolist()
+        divisible_by_25_group = employee_ids[is_divisible_by_25].tolist()
+        sum_divisible_by_5_group = employee_ids[is_sum_divisible_by_5].tolist()
+        extra_esop_group = employee_ids[is_palindrome & is_sum_divisible_by_5].tolist()
+
+        eligible_ids = employee_ids[is_palindrome | is_divisible_by_25 | is_sum_divisible_by_5]
+        total_eligible = eligible_ids.size
+        sorted_eligible_ids = np.sort(eligible_ids)[::-1].tolist()
         
         # Write results to the output file
         with open(output_file, 'w', encoding='utf-8') as file:
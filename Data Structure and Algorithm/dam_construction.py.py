@@ -1,3 +1,5 @@
+from collections import deque
+
 class Graph:
     def __init__(self, num_vertices):
         # Initialize the graph with the given number of vertices (states and junctions)
@@ -21,8 +23,8 @@ class Graph:
 
 class Queue:
     def __init__(self):
-        # Initialization of an empty queue
-        self.queue = []
+        # Initialization of an empty queue, backed by a deque for O(1) removal from the front
+        self.queue = deque()
     
     def enqueue(self, item):
         # Appending an item at the end of the queue
@@ -32,7 +34,7 @@ class Queue:
         # Removing and returning the item from the start of the queue
 
         if not self.is_empty():
-            return self.queue.pop(0)
+            return self.queue.popleft()
         else:
             raise IndexError("Dequeuing from the empty queue.")
     
@@ -114,16 +116,19 @@ def bfs_dam_locations(graph, flow_threshold):
     return dam_locations, bfs_traversal
 
 def write_output(dam_locations, bfs_traversal, output_file, location_map):
+    # Build the reverse mapping once so each index-to-name lookup is O(1)
+    index_to_name = {index: name for name, index in location_map.items()}
+
     # Opening the output file
     with open(output_file, 'w', encoding='utf-8') as ofile:
         # Write BFS Traversal Output
-        bfs_traversal_output = "BFS Traversal Output: " + " → ".join([name for idx in bfs_traversal for name, index in location_map.items() if index == idx])
+        bfs_traversal_output = "BFS Traversal Output: " + " → ".join(index_to_name[idx] for idx in bfs_traversal)
         ofile.write(bfs_traversal_output + "\n")
         
         ofile.write("Dam constructed at Locations:\n")
         for idx, (node_index, flow) in enumerate(dam_locations):
             # Reverse lookup to get the original node name from index
-            original_node_name = [name for name, index in location_map.items() if index == node_index][0]
+            original_node_name = index_to_name[node_index]
             ofile.write(f"{idx + 1}. Node {original_node_name}:\n")  
             ofile.write(f"   Total outgoing flow = {flow}.\n")
             ofile.write(f"   {'Ideal location for a major dam due to high flow.' if flow > 300 else 'Suitable for moderate dam construction.'}\n")
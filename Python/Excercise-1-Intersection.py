@@ -12,9 +12,11 @@ def find_intersection(list1, list2):
  common elements of both lists.
     """
 
+    # A set gives O(1) membership checks instead of scanning list2 each time
+    lookup = set(list2)
     intersection = []
     for element in list1:
-        if element in list2:
+        if element in lookup:
             intersection.append(element)
     return intersection
 
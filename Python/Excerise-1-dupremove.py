@@ -10,13 +10,8 @@ def remove_duplicates(lst):
     A new list with duplicates removed.
   """
 
-  seen = set()
-  result = []
-  for item in lst:
-    if item not in seen:
-      seen.add(item)
-      result.append(item)
-  return result
+  # dict keys keep insertion order, so this dedups in a single C-level pass
+  return list(dict.fromkeys(lst))
 
 
 # Example usage:
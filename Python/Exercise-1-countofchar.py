@@ -1,4 +1,6 @@
 #Write a Python program to count the frequency of each element in a list.
+from collections import Counter
+
 def count_frequency(lst):
     """Counts the frequency of each element in a list.
 
@@ -9,13 +11,7 @@ def count_frequency(lst):
         A dictionary where keys are elements and values are their frequencies.
     """
 
-    freq = {}
-    for element in lst:
-        if element in freq:
-            freq[element] += 1
-        else:
-            freq[element] = 1
-    return freq
+    return dict(Counter(lst))
 
 # Example usage:
 my_list = [1, 3, 2, 3, 3, 3, 4]